@@ -1 +1 @@
-from .rcp import main
\ No newline at end of file
+from .cli import main
\ No newline at end of file
@@ -0,0 +1,99 @@
+import argparse
+import itertools
+import os
+import sys
+from typing import List, Optional
+from .palette import generate_palette
+from .render import FORMATS
+from .terminal import TEXTUAL_COLOR_SYSTEMS, detect_color_depth
+from .vision import DEFICIENCIES, simulate_palette
+
+
+def render(args: argparse.Namespace, output_format: str) -> None:
+    from .data import iter_palette
+    from .render import render_ansi, render_png, render_svg
+
+    # Check the palette before the output file is created
+    if output_format == "ansi":
+        count = sum(1 for _ in itertools.islice(iter_palette(args.palette), 1))
+    else:
+        # Sizes go in the header, so count in a first streaming pass
+        count = sum(1 for _ in iter_palette(args.palette))
+    if not count:
+        raise ValueError("No colors to render")
+
+    binary = output_format == "png"
+    stream = open(args.output, "wb" if binary else "w") if args.output else sys.stdout.buffer if binary else sys.stdout
+    try:
+        if output_format == "ansi":
+            depth = TEXTUAL_COLOR_SYSTEMS[args.color_depth] if args.color_depth else detect_color_depth()
+            render_ansi(iter_palette(args.palette), stream, args.columns, depth)
+        elif output_format == "svg":
+            render_svg(iter_palette(args.palette), stream, args.columns, args.size, count)
+        else:
+            render_png(iter_palette(args.palette), stream, args.columns, args.size, count)
+    finally:
+        if args.output:
+            stream.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="rcp-colors", description="Terminal based rich color picker app.")
+    commands = parser.add_subparsers(dest="command")
+
+    simulate_parser = commands.add_parser("simulate", help="show a palette as seen with a color vision deficiency")
+    simulate_parser.add_argument("deficiency", choices=DEFICIENCIES)
+    simulate_parser.add_argument("palette", nargs="?", help="palette file, defaults to the saved colors")
+    simulate_parser.add_argument("-o", "--output", help="file to write the palette to, defaults to stdout")
+
+    generate_parser = commands.add_parser("generate", help="generate colors with a minimum perceptual distance")
+    generate_parser.add_argument("count", type=int, help="number of colors")
+    generate_parser.add_argument("-d", "--distance", type=float, default=0.1, help="minimum OKLab distance between colors")
+    generate_parser.add_argument("--lightness", type=float, nargs=2, default=(0.0, 1.0), metavar=("MIN", "MAX"), help="HSL lightness bounds")
+    generate_parser.add_argument("--saturation", type=float, nargs=2, default=(0.0, 1.0), metavar=("MIN", "MAX"), help="HSL saturation bounds")
+    generate_parser.add_argument("--seed", type=int, help="seed for reproducible palettes")
+    generate_parser.add_argument("-o", "--output", help="file to write the palette to, defaults to stdout")
+
+    render_parser = commands.add_parser("render", help="render a swatch sheet of a palette")
+    render_parser.add_argument("palette", nargs="?", help="palette file, defaults to the saved colors")
+    render_parser.add_argument("-f", "--format", choices=FORMATS, help="output format, defaults to the output file extension or ansi")
+    render_parser.add_argument("-o", "--output", help="file to write the swatch sheet to, defaults to stdout")
+    render_parser.add_argument("-c", "--columns", type=int, default=8, help="swatches per row")
+    render_parser.add_argument("-s", "--size", type=int, default=64, help="swatch size in pixels for svg and png")
+    render_parser.add_argument("--color-depth", choices=tuple(TEXTUAL_COLOR_SYSTEMS), help="ansi colors to use, defaults to what the terminal supports")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "simulate":
+        from .data import read_palette, write_palette
+        try:
+            write_palette(args.output, simulate_palette(read_palette(args.palette), args.deficiency))
+        except (OSError, ValueError) as error:
+            parser.exit(1, f"rcp-colors: {error}\n")
+    elif args.command == "generate":
+        from .data import write_palette
+        try:
+            palette = generate_palette(args.count, args.distance, tuple(args.lightness), tuple(args.saturation), args.seed)
+            write_palette(args.output, palette)
+        except (OSError, ValueError) as error:
+            parser.exit(1, f"rcp-colors: {error}\n")
+        if len(palette) < args.count:
+            print(f"rcp-colors: only {len(palette)} of {args.count} colors fit, try a smaller distance or wider bounds", file=sys.stderr)
+    elif args.command == "render":
+        output_format = args.format
+        if output_format is None and args.output:
+            extension = os.path.splitext(args.output)[1].lstrip(".").lower()
+            if extension and extension not in FORMATS:
+                parser.error(f"unsupported output extension '.{extension}', use --format with one of: {', '.join(FORMATS)}")
+            output_format = extension or None
+        if args.columns <= 0 or args.size <= 0:
+            parser.error("columns and size have to be greater than 0")
+
+        try:
+            render(args, output_format or "ansi")
+        except (OSError, ValueError) as error:
+            parser.exit(1, f"rcp-colors: {error}\n")
+    else:
+        # Textual is only needed for the interactive app
+        from .rcp import ComputedApp
+        ComputedApp().run()
@@ -0,0 +1,124 @@
+import colorsys
+import itertools
+import json
+import os
+import reprlib
+import appdirs
+from typing import Iterator, List, Optional, Tuple
+from .parser import VALID, parse_color
+
+userdata_dir = appdirs.user_data_dir("RichColorPicker", "PlusPlusMan", "0.1")
+
+os.makedirs(userdata_dir, exist_ok=True)
+
+data_file = os.path.join(userdata_dir, 'data.json')
+
+CHUNK_SIZE = 1 << 16
+
+if not os.path.exists(data_file):
+    with open(data_file, 'w') as f:
+        json.dump(
+            {
+                'dark_mode': True,
+                'sounds': True,
+                'sliders': False,
+                'auto_tab_switch': True,
+                'animation_governor': True,
+                'saved_colors': []
+                }, f, indent=4)
+
+
+def color_entry(red: int, green: int, blue: int) -> dict:
+    """Saved color entry in the same shape the app stores them."""
+    h, l, s = colorsys.rgb_to_hls(red / 255, green / 255, blue / 255)
+    return {
+        'rgb': [red, green, blue],
+        'hsl': [h, s, l],
+        'hex': f"#{red:02X}{green:02X}{blue:02X}"
+    }
+
+
+def entry_rgb(entry) -> Tuple[int, int, int]:
+    if isinstance(entry, str):
+        result = parse_color(entry)
+        if result.state != VALID:
+            raise ValueError(f"Not a color: {reprlib.repr(entry)}")
+        return result.value
+    try:
+        rgb = (int(entry['rgb'][0]), int(entry['rgb'][1]), int(entry['rgb'][2]))
+    except (KeyError, IndexError, TypeError, ValueError):
+        raise ValueError(f"Not a saved color: {entry!r}") from None
+    if not all(0 <= channel <= 255 for channel in rgb):
+        raise ValueError(f"RGB values have to be between 0 and 255: {entry!r}")
+    return rgb
+
+
+def iter_palette(path: Optional[str] = None) -> Iterator[Tuple[int, int, int]]:
+    """Stream the colors of a palette file without loading it whole.
+
+    Palette files are data files with saved colors, JSON lists of entries or
+    text files with one color per line in any notation parse_color() reads.
+    """
+    with open(path or data_file) as f:
+        buffer = f.read(CHUNK_SIZE)
+        if buffer.lstrip().startswith(("{", "[")):
+            yield from _iter_json_entries(f, buffer)
+            return
+        # The first chunk can end halfway through a line
+        line = ""
+        for part in itertools.chain(buffer.splitlines(keepends=True), f):
+            line += part
+            if line.endswith("\n"):
+                if line.strip():
+                    yield entry_rgb(line)
+                line = ""
+        if line.strip():
+            yield entry_rgb(line)
+
+
+def _iter_json_entries(f, buffer: str) -> Iterator:
+    decoder = json.JSONDecoder()
+    position = None
+    while position is None:
+        if buffer.lstrip().startswith("["):
+            position = buffer.index("[") + 1
+        else:
+            key = buffer.find('"saved_colors"')
+            start = buffer.find("[", key) if key != -1 else -1
+            if start != -1:
+                position = start + 1
+            else:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    raise ValueError("No saved colors in palette file")
+                buffer += chunk
+
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            entry, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                raise
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield entry_rgb(entry)
+        position = end
+
+
+def read_palette(path: Optional[str] = None) -> List[Tuple[int, int, int]]:
+    return list(iter_palette(path))
+
+
+def write_palette(path: Optional[str], colors: List[Tuple[int, int, int]]) -> None:
+    entries = [color_entry(*rgb) for rgb in colors]
+    if path is None:
+        print(json.dumps(entries, indent=4))
+    else:
+        with open(path, 'w') as f:
+            json.dump(entries, f, indent=4)
@@ -0,0 +1,53 @@
+from typing import Optional, Tuple
+
+FULL = "full"
+SIMPLIFIED = "simplified"
+SKIPPED = "skipped"
+
+FRAME_BUDGET = 1 / 60  # Textual animates at 60 frames per second
+SAMPLE_INTERVAL = 0.1  # between samples while nothing animates
+DROP_LIMIT = 2.0  # frames longer than this many budgets mean a frame was dropped
+SIMPLIFY_LIMIT = 4.0  # frames up to this many budgets long still animate, simplified
+MIN_DURATION = 0.1
+
+
+class FrameGovernor:
+    """Estimates frame time from event loop lateness and scales animations to fit the frame budget.
+
+    Textual's animator runs on the event loop, so a loop that is late for
+    timers is late for animation frames too. Output is written from a separate
+    thread, so a slow terminal connection only shows up once its queue backs up
+    and blocks the loop.
+    """
+
+    def __init__(self, enabled: bool = True, budget: float = FRAME_BUDGET, smoothing: float = 0.3) -> None:
+        self.enabled = enabled
+        self.budget = budget
+        self.smoothing = smoothing
+        self.frame_time = budget
+        self.last_sample = None  # type: Optional[float]
+
+    def sample(self, now: float, interval: float = SAMPLE_INTERVAL) -> None:
+        """Record a timer tick that was scheduled `interval` seconds after the previous one.
+
+        Whatever the tick is late by is time the event loop spent busy, which is
+        added on top of the budget a frame would normally get. Ticking at the
+        frame budget while an animation runs matches the animator's own timer.
+        """
+        if self.last_sample is not None:
+            lateness = max(0.0, now - self.last_sample - interval)
+            self.frame_time += self.smoothing * (self.budget + lateness - self.frame_time)
+        self.last_sample = now
+
+    def restart(self) -> None:
+        """Forget the previous tick, so a pause in sampling isn't counted as lateness."""
+        self.last_sample = None
+
+    def plan(self, duration: float, easing: str) -> Tuple[str, float, str]:
+        """Decision, duration and easing to use for an animation."""
+        if not self.enabled or self.frame_time <= self.budget * DROP_LIMIT:
+            return FULL, duration, easing
+        if self.frame_time <= self.budget * SIMPLIFY_LIMIT:
+            # Shorten in step with the slowdown and drop the easing curve
+            return SIMPLIFIED, max(MIN_DURATION, duration * self.budget * DROP_LIMIT / self.frame_time), "linear"
+        return SKIPPED, 0.0, easing
@@ -0,0 +1,142 @@
+import colorsys
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+from .vision import SRGB_TO_LINEAR, linear_to_srgb
+
+OKLab = Tuple[float, float, float]
+
+GAMUT_EPSILON = 1e-6
+SEED_ATTEMPTS = 1000
+
+# Closest cells first, they are the likeliest to reject a candidate
+NEIGHBOURS = sorted(
+    ((x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)),
+    key=lambda offset: abs(offset[0]) + abs(offset[1]) + abs(offset[2]),
+)
+
+
+def rgb_to_oklab(red: int, green: int, blue: int) -> OKLab:
+    r, g, b = SRGB_TO_LINEAR[red], SRGB_TO_LINEAR[green], SRGB_TO_LINEAR[blue]
+    l = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+    return (
+        0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+        1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+        0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s,
+    )
+
+
+def oklab_to_linear(lightness: float, a: float, b: float) -> Tuple[float, float, float]:
+    l = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    return (
+        4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+        -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+        -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s,
+    )
+
+
+def generate_palette(
+    count: int,
+    min_distance: float,
+    lightness: Tuple[float, float] = (0.0, 1.0),
+    saturation: Tuple[float, float] = (0.0, 1.0),
+    seed: Optional[int] = None,
+    attempts: int = 30,
+) -> List[Tuple[int, int, int]]:
+    """Up to `count` sRGB colors that are at least `min_distance` apart in OKLab.
+
+    Lightness and saturation bounds are HSL values between 0 and 1, as used by
+    the HSL picker. Points are grown with Poisson-disk sampling over a grid of
+    `min_distance` sized cells, so only the 27 surrounding cells are checked
+    for every candidate. Fewer colors are returned when the bounds cannot fit
+    `count` of them.
+    """
+    if count <= 0:
+        return []
+    if min_distance <= 0:
+        raise ValueError("Minimum distance has to be greater than 0")
+
+    rng = random.Random(seed)
+    scale = 1 / min_distance
+    min_distance_squared = min_distance ** 2
+    # Every HSL color is within the default bounds, so they need no check
+    bounded = tuple(lightness) != (0.0, 1.0) or tuple(saturation) != (0.0, 1.0)
+    grid = {}  # type: Dict[Tuple[int, int, int], List[OKLab]]
+    points = []  # type: List[OKLab]
+    colors = []  # type: List[Tuple[int, int, int]]
+
+    def cell(point: OKLab) -> Tuple[int, int, int]:
+        return (math.floor(point[0] * scale), math.floor(point[1] * scale), math.floor(point[2] * scale))
+
+    def within_bounds(rgb: Tuple[int, int, int]) -> bool:
+        if not bounded:
+            return True
+        _h, l, s = colorsys.rgb_to_hls(rgb[0] / 255, rgb[1] / 255, rgb[2] / 255)
+        return lightness[0] <= l <= lightness[1] and saturation[0] <= s <= saturation[1]
+
+    def far_enough(point: OKLab) -> bool:
+        # Runs for every candidate, so the cell lookup and distance are inlined
+        px, py, pz = point
+        x, y, z = math.floor(px * scale), math.floor(py * scale), math.floor(pz * scale)
+        for dx, dy, dz in NEIGHBOURS:
+            others = grid.get((x + dx, y + dy, z + dz))
+            if others:
+                for ox, oy, oz in others:
+                    ex, ey, ez = px - ox, py - oy, pz - oz
+                    if ex * ex + ey * ey + ez * ez < min_distance_squared:
+                        return False
+        return True
+
+    def add(point: OKLab, rgb: Tuple[int, int, int]) -> None:
+        grid.setdefault(cell(point), []).append(point)
+        points.append(point)
+        colors.append(rgb)
+
+    while len(colors) < count:
+        # Seed every disconnected region the bounds leave open
+        for _ in range(SEED_ATTEMPTS):
+            rgb = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            point = rgb_to_oklab(*rgb)
+            if within_bounds(rgb) and far_enough(point):
+                add(point, rgb)
+                break
+        else:
+            break
+        active = [len(points) - 1]
+
+        while active and len(colors) < count:
+            position = rng.randrange(len(active))
+            origin = points[active[position]]
+            for _ in range(attempts):
+                radius = min_distance * (1 + rng.random())
+                z = 2 * rng.random() - 1
+                theta = 2 * math.pi * rng.random()
+                ring = math.sqrt(1 - z * z) * radius
+                point = (
+                    origin[0] + z * radius,
+                    origin[1] + ring * math.cos(theta),
+                    origin[2] + ring * math.sin(theta),
+                )
+                red, green, blue = oklab_to_linear(*point)
+                if not (
+                    -GAMUT_EPSILON <= red <= 1 + GAMUT_EPSILON
+                    and -GAMUT_EPSILON <= green <= 1 + GAMUT_EPSILON
+                    and -GAMUT_EPSILON <= blue <= 1 + GAMUT_EPSILON
+                ):
+                    continue
+                # Distances are checked on the color as it is stored, after rounding
+                rgb = (linear_to_srgb(red), linear_to_srgb(green), linear_to_srgb(blue))
+                point = rgb_to_oklab(*rgb)
+                if within_bounds(rgb) and far_enough(point):
+                    add(point, rgb)
+                    active.append(len(points) - 1)
+                    break
+            else:
+                active[position] = active[-1]
+                active.pop()
+
+    return colors
@@ -0,0 +1,189 @@
+import colorsys
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+from .palette import oklab_to_linear
+from .vision import linear_to_srgb
+
+EMPTY = "empty"
+PARTIAL = "partial"
+VALID = "valid"
+INVALID = "invalid"
+
+ParseResult = namedtuple("ParseResult", ["state", "value", "notation"])
+
+CSS_COLOR_NAMES = {
+    'aliceblue': 0xF0F8FF, 'antiquewhite': 0xFAEBD7, 'aqua': 0x00FFFF, 'aquamarine': 0x7FFFD4,
+    'azure': 0xF0FFFF, 'beige': 0xF5F5DC, 'bisque': 0xFFE4C4, 'black': 0x000000,
+    'blanchedalmond': 0xFFEBCD, 'blue': 0x0000FF, 'blueviolet': 0x8A2BE2, 'brown': 0xA52A2A,
+    'burlywood': 0xDEB887, 'cadetblue': 0x5F9EA0, 'chartreuse': 0x7FFF00, 'chocolate': 0xD2691E,
+    'coral': 0xFF7F50, 'cornflowerblue': 0x6495ED, 'cornsilk': 0xFFF8DC, 'crimson': 0xDC143C,
+    'cyan': 0x00FFFF, 'darkblue': 0x00008B, 'darkcyan': 0x008B8B, 'darkgoldenrod': 0xB8860B,
+    'darkgray': 0xA9A9A9, 'darkgreen': 0x006400, 'darkgrey': 0xA9A9A9, 'darkkhaki': 0xBDB76B,
+    'darkmagenta': 0x8B008B, 'darkolivegreen': 0x556B2F, 'darkorange': 0xFF8C00, 'darkorchid': 0x9932CC,
+    'darkred': 0x8B0000, 'darksalmon': 0xE9967A, 'darkseagreen': 0x8FBC8F, 'darkslateblue': 0x483D8B,
+    'darkslategray': 0x2F4F4F, 'darkslategrey': 0x2F4F4F, 'darkturquoise': 0x00CED1, 'darkviolet': 0x9400D3,
+    'deeppink': 0xFF1493, 'deepskyblue': 0x00BFFF, 'dimgray': 0x696969, 'dimgrey': 0x696969,
+    'dodgerblue': 0x1E90FF, 'firebrick': 0xB22222, 'floralwhite': 0xFFFAF0, 'forestgreen': 0x228B22,
+    'fuchsia': 0xFF00FF, 'gainsboro': 0xDCDCDC, 'ghostwhite': 0xF8F8FF, 'gold': 0xFFD700,
+    'goldenrod': 0xDAA520, 'gray': 0x808080, 'green': 0x008000, 'greenyellow': 0xADFF2F,
+    'grey': 0x808080, 'honeydew': 0xF0FFF0, 'hotpink': 0xFF69B4, 'indianred': 0xCD5C5C,
+    'indigo': 0x4B0082, 'ivory': 0xFFFFF0, 'khaki': 0xF0E68C, 'lavender': 0xE6E6FA,
+    'lavenderblush': 0xFFF0F5, 'lawngreen': 0x7CFC00, 'lemonchiffon': 0xFFFACD, 'lightblue': 0xADD8E6,
+    'lightcoral': 0xF08080, 'lightcyan': 0xE0FFFF, 'lightgoldenrodyellow': 0xFAFAD2, 'lightgray': 0xD3D3D3,
+    'lightgreen': 0x90EE90, 'lightgrey': 0xD3D3D3, 'lightpink': 0xFFB6C1, 'lightsalmon': 0xFFA07A,
+    'lightseagreen': 0x20B2AA, 'lightskyblue': 0x87CEFA, 'lightslategray': 0x778899, 'lightslategrey': 0x778899,
+    'lightsteelblue': 0xB0C4DE, 'lightyellow': 0xFFFFE0, 'lime': 0x00FF00, 'limegreen': 0x32CD32,
+    'linen': 0xFAF0E6, 'magenta': 0xFF00FF, 'maroon': 0x800000, 'mediumaquamarine': 0x66CDAA,
+    'mediumblue': 0x0000CD, 'mediumorchid': 0xBA55D3, 'mediumpurple': 0x9370DB, 'mediumseagreen': 0x3CB371,
+    'mediumslateblue': 0x7B68EE, 'mediumspringgreen': 0x00FA9A, 'mediumturquoise': 0x48D1CC, 'mediumvioletred': 0xC71585,
+    'midnightblue': 0x191970, 'mintcream': 0xF5FFFA, 'mistyrose': 0xFFE4E1, 'moccasin': 0xFFE4B5,
+    'navajowhite': 0xFFDEAD, 'navy': 0x000080, 'oldlace': 0xFDF5E6, 'olive': 0x808000,
+    'olivedrab': 0x6B8E23, 'orange': 0xFFA500, 'orangered': 0xFF4500, 'orchid': 0xDA70D6,
+    'palegoldenrod': 0xEEE8AA, 'palegreen': 0x98FB98, 'paleturquoise': 0xAFEEEE, 'palevioletred': 0xDB7093,
+    'papayawhip': 0xFFEFD5, 'peachpuff': 0xFFDAB9, 'peru': 0xCD853F, 'pink': 0xFFC0CB,
+    'plum': 0xDDA0DD, 'powderblue': 0xB0E0E6, 'purple': 0x800080, 'rebeccapurple': 0x663399,
+    'red': 0xFF0000, 'rosybrown': 0xBC8F8F, 'royalblue': 0x4169E1, 'saddlebrown': 0x8B4513,
+    'salmon': 0xFA8072, 'sandybrown': 0xF4A460, 'seagreen': 0x2E8B57, 'seashell': 0xFFF5EE,
+    'sienna': 0xA0522D, 'silver': 0xC0C0C0, 'skyblue': 0x87CEEB, 'slateblue': 0x6A5ACD,
+    'slategray': 0x708090, 'slategrey': 0x708090, 'snow': 0xFFFAFA, 'springgreen': 0x00FF7F,
+    'steelblue': 0x4682B4, 'tan': 0xD2B48C, 'teal': 0x008080, 'thistle': 0xD8BFD8,
+    'tomato': 0xFF6347, 'turquoise': 0x40E0D0, 'violet': 0xEE82EE, 'wheat': 0xF5DEB3,
+    'white': 0xFFFFFF, 'whitesmoke': 0xF5F5F5, 'yellow': 0xFFFF00, 'yellowgreen': 0x9ACD32,
+}
+
+NAME_PREFIXES = frozenset(name[:end] for name in CSS_COLOR_NAMES for end in range(1, len(name)))
+
+# Each digit belongs to one part of the number, so failed matches on long digit runs are linear
+_NUMBER = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)"
+_SEPARATOR = r"(?:\s*,\s*|\s+)"
+_ALPHA = rf"(?:\s*[,/]\s*{_NUMBER}%?)?"
+
+COLOR_GRAMMAR = re.compile(
+    rf"""
+    \#(?P<hex>[0-9a-f]{{3,4}}|[0-9a-f]{{6}}|[0-9a-f]{{8}})
+    | rgba?\(\s*
+        (?P<red>{_NUMBER})(?P<red_unit>%?){_SEPARATOR}
+        (?P<green>{_NUMBER})(?P<green_unit>%?){_SEPARATOR}
+        (?P<blue>{_NUMBER})(?P<blue_unit>%?){_ALPHA}\s*\)
+    | hsla?\(\s*
+        (?P<hue>{_NUMBER})(?P<hue_unit>deg|grad|rad|turn)?{_SEPARATOR}
+        (?P<saturation>{_NUMBER})%?{_SEPARATOR}
+        (?P<lightness>{_NUMBER})%?{_ALPHA}\s*\)
+    | oklch\(\s*
+        (?P<ok_lightness>{_NUMBER})(?P<ok_lightness_unit>%?)\s+
+        (?P<chroma>{_NUMBER})(?P<chroma_unit>%?)\s+
+        (?P<ok_hue>{_NUMBER})(?P<ok_hue_unit>deg|grad|rad|turn)?{_ALPHA}\s*\)
+    | (?P<name>[a-z]+)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# Anything a complete color could still be typed into
+PARTIAL_GRAMMAR = re.compile(
+    r"""
+    \#[0-9a-f]{0,7}
+    | r(?:g(?:ba?)?)? | h(?:s(?:la?)?)? | o(?:k(?:l(?:ch?)?)?)?
+    | (?:rgba?|hsla?|oklch)\([0-9a-z.,%/+\-\s]*
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+COMPONENT_GRAMMARS = {
+    # Longer whole parts are never valid and would overflow int() and float()
+    "rgb": re.compile(r"(?P<value>\d{1,4})"),
+    "hsl": re.compile(r"(?P<value>\d{0,4}(?:\.\d*)?)"),
+}
+
+MAX_COLOR_LENGTH = 128  # far longer than any color, so pastes are rejected before matching
+
+HUE_UNITS = {None: 1 / 360, "deg": 1 / 360, "grad": 1 / 400, "rad": 1 / (2 * math.pi), "turn": 1.0}
+
+
+def _channel(value: float) -> int:
+    return min(255, max(0, round(value)))
+
+
+def _from_match(match) -> ParseResult:
+    groups = match.groupdict()
+    if groups["hex"] is not None:
+        digits = groups["hex"]
+        if len(digits) <= 4:
+            digits = "".join(digit * 2 for digit in digits)
+        return ParseResult(VALID, (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16)), "hex")
+
+    if groups["red"] is not None:
+        channels = [
+            float(groups[channel]) * (2.55 if groups[channel + "_unit"] else 1)
+            for channel in ("red", "green", "blue")
+        ]
+        if not all(map(math.isfinite, channels)):
+            return ParseResult(INVALID, None, None)
+        return ParseResult(VALID, tuple(_channel(channel) for channel in channels), "rgb")
+
+    if groups["hue"] is not None:
+        hue, saturation, lightness = float(groups["hue"]), float(groups["saturation"]), float(groups["lightness"])
+        if not all(map(math.isfinite, (hue, saturation, lightness))):
+            return ParseResult(INVALID, None, None)
+        hue = hue * HUE_UNITS[groups["hue_unit"] and groups["hue_unit"].lower()] % 1.0
+        saturation = min(1.0, max(0.0, saturation / 100))
+        lightness = min(1.0, max(0.0, lightness / 100))
+        red, green, blue = colorsys.hls_to_rgb(hue, lightness, saturation)
+        return ParseResult(VALID, (_channel(red * 255), _channel(green * 255), _channel(blue * 255)), "hsl")
+
+    if groups["ok_lightness"] is not None:
+        lightness = float(groups["ok_lightness"]) / (100 if groups["ok_lightness_unit"] else 1)
+        chroma = float(groups["chroma"]) * (0.004 if groups["chroma_unit"] else 1)
+        hue = float(groups["ok_hue"]) * HUE_UNITS[groups["ok_hue_unit"] and groups["ok_hue_unit"].lower()] * 2 * math.pi
+        if not all(map(math.isfinite, (lightness, chroma, hue))):
+            return ParseResult(INVALID, None, None)
+        # Chroma past 1 is far outside sRGB for every hue and would overflow oklab_to_linear
+        chroma = min(1.0, max(0.0, chroma))
+        linear = oklab_to_linear(min(1.0, max(0.0, lightness)), chroma * math.cos(hue), chroma * math.sin(hue))
+        return ParseResult(VALID, tuple(linear_to_srgb(channel) for channel in linear), "oklch")
+
+    name = groups["name"].lower()
+    if name in CSS_COLOR_NAMES:
+        value = CSS_COLOR_NAMES[name]
+        return ParseResult(VALID, (value >> 16, (value >> 8) & 0xFF, value & 0xFF), "name")
+    if name in NAME_PREFIXES:
+        return ParseResult(PARTIAL, None, "name")
+    return ParseResult(INVALID, None, None)
+
+
+@lru_cache(maxsize=256)
+def parse_color(text: str) -> ParseResult:
+    """Parse hex, rgb(), hsl(), oklch() or named colors without raising.
+
+    Value is an (r, g, b) tuple for valid input and None otherwise. Input that
+    is not a color yet but could still become one is reported as partial.
+    """
+    text = text.strip()
+    if not text:
+        return ParseResult(EMPTY, None, None)
+    if len(text) > MAX_COLOR_LENGTH:
+        return ParseResult(INVALID, None, None)
+    match = COLOR_GRAMMAR.fullmatch(text)
+    if match is not None:
+        result = _from_match(match)
+        if result.state != INVALID:
+            return result
+    if PARTIAL_GRAMMAR.fullmatch(text):
+        return ParseResult(PARTIAL, None, "hex" if text.startswith("#") else None)
+    return ParseResult(INVALID, None, None)
+
+
+@lru_cache(maxsize=256)
+def parse_component(text: str, notation: str) -> ParseResult:
+    """Parse a single RGB (whole number) or HSL (float) component, empty input counting as 0."""
+    if not text:
+        return ParseResult(EMPTY, 0, notation)
+    match = COMPONENT_GRAMMARS[notation].fullmatch(text)
+    if match is None:
+        return ParseResult(INVALID, None, notation)
+    if notation == "rgb":
+        return ParseResult(VALID, int(text), notation)
+    if text == ".":
+        return ParseResult(PARTIAL, 0.0, notation)
+    return ParseResult(VALID, float(text), notation)
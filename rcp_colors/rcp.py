@@ -7,11 +7,20 @@ from textual.widgets import Input, Static, Label, TabbedContent, TabPane, Footer
 from textual.containers import Grid
 from textual.screen import ModalScreen
 import random
-import re
-import os
 import json
-import appdirs
 import math
+import time
+from .data import data_file, color_entry
+from .governor import FrameGovernor, FRAME_BUDGET, SAMPLE_INTERVAL, SKIPPED
+from .palette import generate_palette
+from .parser import CSS_COLOR_NAMES, INVALID, PARTIAL, VALID, parse_color, parse_component
+from .terminal import detect_color_depth, quantize, TRUECOLOR
+from .vision import NORMAL, VISION_MODES, simulate, simulate_palette
+
+PALETTE_SIZE = 8
+PALETTE_DISTANCE = 0.15  # minimum OKLab distance between generated colors
+
+ANY_COLOR_NOTATIONS = "HEX, rgb(), hsl(), oklch() or color name"
 
 def animation_time(n_items: int) -> float:
     base_time = 1.0  # base time for 10 items
@@ -41,8 +50,11 @@ ___
 - Loose focus from the color inputs by pressing `Enter`
 - Switch between tabs by pressing `Tab` or `Shift+Tab`
 - Switch between color inputs by pressing `Right Arrow` or `Left Arrow`
+- Paste hex, `rgb()`, `hsl()`, `oklch()` or color names into the `Any` tab
 - Save a color by pressing `s` or clicking the `Save color` button
 - Randomize the color by pressing `r` or clicking the `Randomize` button
+- Generate a palette of well distinguishable colors by pressing `g`
+- Preview colors with color vision deficiencies by pressing `v`
 - Quit the app by pressing `q` or clicking the `Quit` button
 
 
@@ -71,24 +83,6 @@ COLORS = [
 'deepskyblue', 'dimgray', 'dimgrey',
 ]
 
-userdata_dir = appdirs.user_data_dir("RichColorPicker", "PlusPlusMan", "0.1")
-
-os.makedirs(userdata_dir, exist_ok=True)
-
-data_file = os.path.join(userdata_dir, 'data.json')
-
-if not os.path.exists(data_file):
-    with open(data_file, 'w') as f:
-        json.dump(
-            {
-                'dark_mode': True,
-                'sounds': True,
-                'sliders': False,
-                'auto_tab_switch': True,
-                'saved_colors': []
-                }, f, indent=4)
-        
-
 class SavedColor(Static):
     def __init__(self, label_content):
         super().__init__(classes="saved-color")
@@ -98,10 +92,13 @@ class SavedColor(Static):
         with Vertical(classes="content-container") as h:
             with Horizontal(classes="content-container-top"):         
                 with Static(id="content-container-color") as s:
-                    s.styles.background = Color(self.content['rgb'][0], self.content['rgb'][1], self.content['rgb'][2])
+                    s.styles.background = Color(*simulate(self.content['rgb'][0], self.content['rgb'][1], self.content['rgb'][2], self.app.vision))
             with Horizontal(classes="content-container-bottom"):
                 yield Label(f"RGB: [b]{self.content['rgb'][0]} {self.content['rgb'][1]} {self.content['rgb'][2]}[/b]\nHSL: [b]{self.content['hsl'][0]:0.2f} {self.content['hsl'][1]:0.2f} {self.content['hsl'][2]:0.2f}[/b]\nHEX: [b]{self.content['hex']}[/b]", classes="color-values")
                 yield Button("Remove", classes="remove", variant="error")
+    
+    def show_color(self, color: Color) -> None:
+        self.query_one("#content-container-color").styles.background = color
                 
         
 class QuitScreen(ModalScreen):
@@ -169,6 +166,14 @@ Screen {
     border-title-color: $secondary-lighten-2;
     border-title-style: bold italic;
     border-title-align: center;
+    border-subtitle-style: italic;
+}
+
+.terminal-label { /* Color as shown by 16 and 256 color terminals */
+    dock: top;
+    width: 100%;
+    height: 1;
+    text-align: center;
 }
 
 .color-label { /* Label inside color panel */
@@ -232,6 +237,11 @@ Screen {
     color: silver;
 }
 
+#any { /* Universal color input */
+    margin: 0 10;
+    color: silver;
+}
+
 /* Quit Screen */
 QuitScreen {
     align: center middle;
@@ -327,6 +337,10 @@ Switch {
     offset: -3 0;
 }
 
+#animation-governor-container {
+    offset: -5 0;
+}
+
 #remove-all-label {
     color: $error;
 }
@@ -396,6 +410,8 @@ Switch {
     BINDINGS = [
         ("s", "save_color", "Save color"),
         ("r", "randomize", "Randomize"),
+        ("g", "generate_palette", "Generate palette"),
+        ("v", "cycle_vision", "Vision"),
         ("q", "quit", "Quit")
     ]
 
@@ -411,12 +427,18 @@ Switch {
     color_rgb = reactive(Color.parse("black"))
     color_hsl = reactive(Color.parse("black"), always_update=True)
     color_hex = reactive(Color.parse("black"))
+    color_any = reactive(Color.parse("black"))
+    color_preview = reactive(None, init=False)
     
     settings = json.load(open(data_file))
     dark_mode = reactive(settings['dark_mode'])
     sounds = reactive(settings['sounds'])
     sliders = reactive(settings['sliders'])
     auto_tab_switch = reactive(settings['auto_tab_switch'])
+    animation_governor = reactive(settings.get('animation_governor', True))
+    
+    color_depth = detect_color_depth()
+    vision = reactive(NORMAL, init=False)
 
     def compose(self) -> ComposeResult:
         with TabbedContent(id="main") as tabs:
@@ -425,6 +447,7 @@ Switch {
                     yield Label("RGB Color Picker", classes="title-label")
                 with Static(id="rgb-color", classes="color") as s:
                     s.border_title = "Color"
+                    yield Label(id="rgb-terminal-label", classes="terminal-label")
                     yield Label(id="rgb-color-label", classes="color-label")
                 with Horizontal(id="color-inputs") as h:
                     h.border_subtitle = "Whole value between 0 and 255"
@@ -446,6 +469,7 @@ Switch {
                     yield Label("HSL Color Picker", classes="title-label")
                 with Static(id="hsl-color", classes="color") as s:
                     s.border_title = "Color"
+                    yield Label(id="hsl-terminal-label", classes="terminal-label")
                     yield Label(id="hsl-color-label", classes="color-label")
                 with Horizontal(id="color-inputs") as h:
                     h.border_subtitle = "Float values between 0.0 and 0.999"
@@ -467,6 +491,7 @@ Switch {
                     yield Label("HEX Color Picker", classes="title-label")
                 with Static(id="hex-color", classes="color") as s:
                     s.border_title = "Color"
+                    yield Label(id="hex-terminal-label", classes="terminal-label")
                     yield Label(id="hex-color-label", classes="color-label")
                 with Horizontal(id="color-inputs") as h:
                     h.border_subtitle = "Hexadecimal value"
@@ -475,6 +500,20 @@ Switch {
                         _input.border_title = "Hex:"
                         yield _input
             
+            with TabPane("Any", id="any_tab"):
+                with Static(id="title"):
+                    yield Label("Universal Color Picker", classes="title-label")
+                with Static(id="any-color", classes="color") as s:
+                    s.border_title = "Color"
+                    yield Label(id="any-terminal-label", classes="terminal-label")
+                    yield Label(id="any-color-label", classes="color-label")
+                with Horizontal(id="color-inputs", classes="any-color-inputs") as h:
+                    h.border_subtitle = ANY_COLOR_NOTATIONS
+                    with Vertical() as v:
+                        _input = Input(placeholder="Enter any color", id="any", classes="color-input")
+                        _input.border_title = "Color:"
+                        yield _input
+            
             with TabPane("Saved", id="saved_tab"):
                 saved_colors = json.load(open(data_file))['saved_colors']
                 with Static(id="title"):
@@ -512,6 +551,9 @@ Switch {
                     with Horizontal(classes="settings-container", id="auto-tab-switch-container"):
                         yield Label("Auto Tab Switch:", classes="settings-label")
                         yield Switch(self.auto_tab_switch, id="auto-tab-switch", classes="settings-switch")
+                    with Horizontal(classes="settings-container", id="animation-governor-container"):
+                        yield Label("Animation Governor:", classes="settings-label")
+                        yield Switch(self.animation_governor, id="animation-governor-switch", classes="settings-switch")
                     with Horizontal(classes="settings-container"):
                         yield Label("Sliders:  ", classes="settings-label")
                         yield Switch(id="sliders-switch", classes="settings-switch", disabled=True)
@@ -527,9 +569,15 @@ Switch {
         
     def on_mount(self) -> None:
         self.dark = self.dark_mode
+        self.governor = FrameGovernor(enabled=self.animation_governor)
+        self.animations = 0
+        self.idle_timer = self.set_interval(SAMPLE_INTERVAL, self.sample_idle_time, pause=not self.animation_governor)
+        self.frame_timer = self.set_interval(FRAME_BUDGET, self.sample_frame_time, pause=True)
+        for label in self.query(".terminal-label"):
+            label.display = self.color_depth < TRUECOLOR
         
     def action_save_color(self) -> None:
-        if self.query_one(TabbedContent).active in ["rgb_tab", "hsl_tab", "hex_tab"]:
+        if self.query_one(TabbedContent).active in ["rgb_tab", "hsl_tab", "hex_tab", "any_tab"]:
             data = dict()
             if self.query_one(TabbedContent).active == "rgb_tab":
                 data = {
@@ -549,6 +597,12 @@ Switch {
                     'hsl': [self.color_hex.hsl.h, self.color_hex.hsl.s, self.color_hex.hsl.l],
                     'hex': self.color_hex
                 }
+            elif self.query_one(TabbedContent).active == "any_tab":
+                data = {
+                    'rgb': self.color_any.rgb,
+                    'hsl': [self.color_any.hsl.h, self.color_any.hsl.s, self.color_any.hsl.l],
+                    'hex': self.color_any.hex
+                }
 
             settings_data = json.load(open(data_file, "r"))
             settings_data["saved_colors"].append(data)
@@ -558,11 +612,12 @@ Switch {
             
             if self.auto_tab_switch:
                 self.query_one(TabbedContent).active = "saved_tab"
-                self.query_one("#saved-colors-container").scroll_end(easing='in_out_quad', duration=animation_time(len(self.query_one("#saved-colors-container").children)))
+                decision, duration, easing = self.governed_animation("scroll_end", animation_time(len(self.query_one("#saved-colors-container").children)), 'in_out_quad')
+                self.query_one("#saved-colors-container").scroll_end(animate=decision != SKIPPED, easing=easing, duration=duration)
         
     @on(OptionList.OptionSelected, "#color-option-list")
     def update_color(self, event: OptionList.OptionSelected) -> None:
-        self.query_one("#color-preview").styles.animate("background", value=Color.parse(event.option.prompt), duration=0.5)
+        self.color_preview = Color.parse(event.option.prompt)
         _rgb = Color.parse(event.option.prompt).rgb
         _hsl = Color.parse(event.option.prompt).hsl
         _hex = Color.parse(event.option.prompt).hex
@@ -581,6 +636,12 @@ Switch {
     async def toggle_auto_tab_switch(self, event: Switch.Changed) -> None:
         self.auto_tab_switch = not self.auto_tab_switch
         
+    @on(Switch.Changed, "#animation-governor-switch")
+    async def toggle_animation_governor(self, event: Switch.Changed) -> None:
+        self.animation_governor = not self.animation_governor
+        self.governor.enabled = self.animation_governor
+        self.update_sampling()
+        
     @on(Switch.Changed, ".settings-switch") 
     def update_settings(self, event: Switch.Changed) -> None:
         settings_data = json.load(open(data_file, "r"))
@@ -588,12 +649,17 @@ Switch {
         settings_data["sounds"] = self.sounds
         settings_data["sliders"] = self.sliders
         settings_data["auto_tab_switch"] = self.auto_tab_switch
+        settings_data["animation_governor"] = self.animation_governor
         json.dump(settings_data, open(data_file, "w"), indent=4)
     
     @on(Button.Pressed, ".remove")
     async def remove_color(self, event: Button.Pressed) -> None:
         container_to_remove = event.button.parent.parent.parent
-        event.button.parent.parent.parent.styles.animate("opacity", 0.1, duration=0.5, on_complete=container_to_remove.remove)
+        decision, duration, easing = self.governed_animation("opacity", 0.5, 'in_out_cubic')
+        if decision == SKIPPED:
+            container_to_remove.remove()
+        else:
+            container_to_remove.styles.animate("opacity", 0.1, duration=duration, easing=easing, on_complete=container_to_remove.remove)
 
     @on(Button.Pressed, "#remove-all-button")
     async def remove_all(self, event: Button.Pressed) -> None:
@@ -607,26 +673,114 @@ Switch {
     def action_quit(self):
         self.push_screen(QuitScreen())
         
+    def sample_idle_time(self) -> None:
+        self.governor.sample(time.monotonic(), SAMPLE_INTERVAL)
+        
+    def sample_frame_time(self) -> None:
+        self.governor.sample(time.monotonic(), FRAME_BUDGET)
+        
+    def update_sampling(self) -> None:
+        """Sample at the frame rate while animations run, slower while idle and not at all with the governor off."""
+        self.governor.restart()
+        if self.animation_governor and self.animations:
+            self.idle_timer.pause()
+            self.frame_timer.resume()
+        elif self.animation_governor:
+            self.frame_timer.pause()
+            self.idle_timer.resume()
+        else:
+            self.frame_timer.pause()
+            self.idle_timer.pause()
+        
+    def end_animation(self) -> None:
+        self.animations -= 1
+        if not self.animations:
+            self.update_sampling()
+        
+    def governed_animation(self, name: str, duration: float, easing: str):
+        decision, governed_duration, governed_easing = self.governor.plan(duration, easing)
+        self.log.debug(f"Animation governor: {name} {decision}, frame time {self.governor.frame_time * 1000:0.1f} ms, duration {governed_duration:0.2f}s ({governed_easing}), {len(self.query(SavedColor))} saved colors")
+        if decision != SKIPPED:
+            self.animations += 1
+            if self.animations == 1:
+                self.update_sampling()
+            self.set_timer(governed_duration, self.end_animation)
+        return decision, governed_duration, governed_easing
+        
+    def action_generate_palette(self) -> None:
+        palette = [color_entry(*rgb) for rgb in generate_palette(PALETTE_SIZE, PALETTE_DISTANCE)]
+        
+        settings_data = json.load(open(data_file, "r"))
+        settings_data["saved_colors"].extend(palette)
+        json.dump(settings_data, open(data_file, "w"), indent=4)
+        self.query_one("#saved-colors-container").mount(*(SavedColor(label_content=data) for data in palette))
+        
+        if self.auto_tab_switch:
+            self.query_one(TabbedContent).active = "saved_tab"
+            decision, duration, easing = self.governed_animation("scroll_end", animation_time(len(self.query_one("#saved-colors-container").children)), 'in_out_quad')
+            self.query_one("#saved-colors-container").scroll_end(animate=decision != SKIPPED, easing=easing, duration=duration)
+
+    def action_cycle_vision(self):
+        self.vision = VISION_MODES[(VISION_MODES.index(self.vision) + 1) % len(VISION_MODES)]
+
+    def watch_vision(self, vision: str) -> None:
+        subtitle = "" if vision == NORMAL else f"Simulating {vision}"
+        for panel in self.query(".color"):
+            panel.border_subtitle = subtitle
+        self.query_one("#saved-colors-container").border_subtitle = subtitle
+        self.watch_color_rgb(self.color_rgb)
+        self.watch_color_hsl(self.color_hsl)
+        self.watch_color_hex(self.color_hex)
+        self.watch_color_any(self.color_any)
+        if self.color_preview is not None:
+            self.watch_color_preview(self.color_preview)
+        
+        saved_colors = list(self.query(SavedColor))
+        simulated = simulate_palette((saved_color.content['rgb'] for saved_color in saved_colors), vision)
+        for saved_color, rgb in zip(saved_colors, simulated):
+            saved_color.show_color(Color(*rgb))
+
+    def simulated(self, color: Color) -> Color:
+        if self.vision == NORMAL:
+            return color
+        return Color(*simulate(*color.rgb, self.vision))
+
     def action_randomize(self):
         if self.query_one(TabbedContent).active == "rgb_tab":
             self.red = random.randint(0, 255)
             self.green = random.randint(0, 255)
             self.blue = random.randint(0, 255)
         elif self.query_one(TabbedContent).active == "hsl_tab":
-            self.hue = float(f"0.{random.randint(0, 999)}")
-            self.saturation = float(f"0.{random.randint(0, 999)}")
-            self.lightness = float(f"0.{random.randint(0, 999)}")
+            self.hue = random.random()
+            self.saturation = random.random()
+            self.lightness = random.random()
         elif self.query_one(TabbedContent).active == "hex_tab":
             hex_digits = "0123456789abcdef"
             random_hex = "".join(random.choice(hex_digits) for _ in range(6))
             self.color_hex = Color.parse(f"#{random_hex}")
+        elif self.query_one(TabbedContent).active == "any_tab":
+            self.query_one("#any").value = random.choice(list(CSS_COLOR_NAMES))
         elif self.query_one(TabbedContent).active == "colors_tab":
             random_color = random.choice(COLORS)
-            self.query_one("#color-preview").styles.animate("background", value=Color.parse(random_color), duration=0.5)
+            self.color_preview = Color.parse(random_color)
             self.query_one("#color-option-list").highlighted = COLORS.index(random_color)
             self.query_one("#color-preview-label").update(f"RGB: {Color.parse(random_color).rgb[0]} {Color.parse(random_color).rgb[1]} {Color.parse(random_color).rgb[2]}\nHSL: {Color.parse(random_color).hsl.h:0.2f} {Color.parse(random_color).hsl.s:0.2f} {Color.parse(random_color).hsl.l:0.2f}\nHEX: {Color.parse(random_color).hex}")
         elif self.query_one(TabbedContent).active == "saved_tab":
-            self.query_one("#saved-colors-container").scroll_to_widget(random.choice(self.query_one("#saved-colors-container").children), easing='in_out_back', duration=animation_time(len(self.query_one("#saved-colors-container").children)))
+            decision, duration, easing = self.governed_animation("scroll_to_widget", animation_time(len(self.query_one("#saved-colors-container").children)), 'in_out_back')
+            self.query_one("#saved-colors-container").scroll_to_widget(random.choice(self.query_one("#saved-colors-container").children), animate=decision != SKIPPED, easing=easing, duration=duration)
+
+    def update_terminal_label(self, label_id: str, color: Color) -> None:
+        if self.color_depth >= TRUECOLOR:
+            return
+        shown = self.simulated(color)
+        quantized = Color(*quantize(*shown.rgb, self.color_depth))
+        label = self.query_one(label_id)
+        if self.vision == NORMAL:
+            label.update(f"Terminal ({self.color_depth} colors): [b]{quantized.hex}[/b]  True color: [b]{color.hex}[/b]")
+        else:
+            label.update(f"Terminal ({self.color_depth} colors): [b]{quantized.hex}[/b]  Simulated: [b]{shown.hex}[/b]")
+        label.styles.background = quantized
+        label.styles.color = quantized.get_contrast_text()
 
     def compute_color_rgb(self) -> Color:
         return Color(self.red, self.green, self.blue).clamped
@@ -635,11 +789,12 @@ Switch {
         rgb_to_hsl = color_rgb.hsl
         rgb_to_hex = color_rgb.hex
         self.query_one("#rgb-color-label").update(f"\n[uu]RGB: [b]{self.red} {self.green} {self.blue}[/b][/uu]\nHSL: [b]{rgb_to_hsl.h:0.2f} {rgb_to_hsl.s:0.2f} {rgb_to_hsl.l:0.2f}[/b]\nHEX: [b]{rgb_to_hex}[/b]")
-        self.query_one("#rgb-color").styles.background = color_rgb
+        self.query_one("#rgb-color").styles.background = self.simulated(color_rgb)
         self.query_one("#rgb-color-label").styles.background = Color.with_alpha(color_rgb.inverse, 0.25)
         self.query_one("#rgb-color-label").styles.border = ("wide", Color.with_alpha(color_rgb.inverse, 0.8))
         self.query_one("#rgb-color").styles.border = ("hkey", Color.with_alpha(color_rgb.inverse, 0.8))
         self.query_one("#rgb-color").styles.border_title_color = Color.with_alpha(color_rgb.inverse, 0.8)
+        self.update_terminal_label("#rgb-terminal-label", color_rgb)
     
     def compute_color_hsl(self) -> Color:
         color = Color.from_hsl(h=self.hue, s=self.saturation, l=self.lightness).clamped
@@ -648,87 +803,101 @@ Switch {
     def watch_color_hsl(self, color_hsl: Color) -> None:
         hsl_to_rgb = color_hsl.rgb
         hsl_to_hex = color_hsl.hex
-        self.query_one("#hsl-color").styles.background = color_hsl
+        self.query_one("#hsl-color").styles.background = self.simulated(color_hsl)
         self.query_one("#hsl-color-label").update(f"\n[uu]HSL: [b]{self.hue:0.2f} {self.saturation:0.2f} {self.lightness:0.2f}[/b][/uu]\nRGB: [b]{hsl_to_rgb[0]} {hsl_to_rgb[1]} {hsl_to_rgb[2]}[/b]\nHEX: [b]{hsl_to_hex}[/b]")
         self.query_one("#hsl-color-label").styles.background = Color.with_alpha(color_hsl.inverse, 0.25)
         self.query_one("#hsl-color-label").styles.border = ("wide", Color.with_alpha(color_hsl.inverse, 0.8))
         self.query_one("#hsl-color").styles.border = ("hkey", Color.with_alpha(color_hsl.inverse, 0.8))
         self.query_one("#hsl-color").styles.border_title_color = Color.with_alpha(color_hsl.inverse, 0.8)
+        self.update_terminal_label("#hsl-terminal-label", color_hsl)
     
     def watch_color_hex(self, color_hex: Color) -> None:
         hex_to_rgb = color_hex.rgb
         hex_to_hsl = color_hex.hsl
-        self.query_one("#hex-color").styles.background = color_hex
+        self.query_one("#hex-color").styles.background = self.simulated(color_hex)
         self.query_one("#hex-color-label").update(f"\n[uu]HEX: [b]{self.color_hex.hex}[/b][/uu]\nRGB: [b]{hex_to_rgb[0]} {hex_to_rgb[1]} {hex_to_rgb[2]}[/b]\nHSL: [b]{hex_to_hsl.h:0.2f} {hex_to_hsl.s:0.2f} {hex_to_hsl.l:0.2f}[/b]")
         self.query_one("#hex-color-label").styles.background = Color.with_alpha(color_hex.inverse, 0.25)
         self.query_one("#hex-color-label").styles.border = ("wide", Color.with_alpha(color_hex.inverse, 0.8))
         self.query_one("#hex-color").styles.border = ("hkey", Color.with_alpha(color_hex.inverse, 0.8))
         self.query_one("#hex-color").styles.border_title_color = Color.with_alpha(color_hex.inverse, 0.8)
+        self.update_terminal_label("#hex-terminal-label", color_hex)
+    
+    def watch_color_preview(self, color_preview: Color) -> None:
+        self.query_one("#color-preview").styles.animate("background", value=self.simulated(color_preview), duration=0.5)
+    
+    def watch_color_any(self, color_any: Color) -> None:
+        any_to_rgb = color_any.rgb
+        any_to_hsl = color_any.hsl
+        self.query_one("#any-color").styles.background = self.simulated(color_any)
+        self.query_one("#any-color-label").update(f"\n[uu]HEX: [b]{color_any.hex}[/b][/uu]\nRGB: [b]{any_to_rgb[0]} {any_to_rgb[1]} {any_to_rgb[2]}[/b]\nHSL: [b]{any_to_hsl.h:0.2f} {any_to_hsl.s:0.2f} {any_to_hsl.l:0.2f}[/b]")
+        self.query_one("#any-color-label").styles.background = Color.with_alpha(color_any.inverse, 0.25)
+        self.query_one("#any-color-label").styles.border = ("wide", Color.with_alpha(color_any.inverse, 0.8))
+        self.query_one("#any-color").styles.border = ("hkey", Color.with_alpha(color_any.inverse, 0.8))
+        self.query_one("#any-color").styles.border_title_color = Color.with_alpha(color_any.inverse, 0.8)
+        self.update_terminal_label("#any-terminal-label", color_any)
         
     def on_input_changed(self, event: Input.Changed) -> None:
         
         if self.query_one(TabbedContent).active == "rgb_tab":
-            try:
-                component = event.value
-                if component == "":
-                    component = 0
-                elif len(event.input.value) > 3:
-                    raise IndexError
-                elif int(event.input.value) > 255:
-                    event.input.value = "255"
-                elif len(event.input.value) > 1 and event.input.value[0] == "0":
-                    event.input.value = event.input.value[1:]
-                component = int(component)
-            except ValueError:
+            result = parse_component(event.value, "rgb")
+            if len(event.value) > 3:
+                event.input.value = event.value[0:3]
+            elif result.state == INVALID:
                 event.input.value = event.value[0:-1]
                 if self.sounds:
                     self.bell()
-            except IndexError:
-                event.input.value = event.value[0:-1]
+            elif result.value > 255:
+                event.input.value = "255"
+            elif len(event.value) > 1 and event.value[0] == "0":
+                event.input.value = event.value[1:]
+            elif event.input.id == "red":
+                self.red = result.value
+            elif event.input.id == "green":
+                self.green = result.value
             else:
-                if event.input.id == "red":
-                    self.red = component
-                elif event.input.id == "green":
-                    self.green = component
-                else:
-                    self.blue = component
+                self.blue = result.value
                     
         elif self.query_one(TabbedContent).active == "hsl_tab":
-            try:
-                component = event.value
-                if component == "":
-                    component = 0
-                component = float(component)
-            except ValueError:
+            result = parse_component(event.value, "hsl")
+            if result.state == INVALID:
                 event.input.value = event.value[0:-1]
-                if self.sounds():
+                if self.sounds:
                     self.bell()
-            except IndexError:
-                event.input.value = event.value[0:-1]
+            elif event.input.id == "hue":
+                self.hue = result.value
+            elif event.input.id == "saturation":
+                self.saturation = result.value
             else:
-                if event.input.id == "hue":
-                    self.hue = component
-                elif event.input.id == "saturation":
-                    self.saturation = component
-                else:
-                    self.lightness = component
+                self.lightness = result.value
                     
         elif self.query_one(TabbedContent).active == "hex_tab":
-            pattern = "^#([A-Fa-f0-9]{1,8})$"
             component = f"#{event.value}" if not event.value.startswith("#") else event.value
-            component = str(component)
+            result = parse_color(component)
 
-            if not re.match(pattern, component) and component != "#":
+            if result.state == INVALID or result.notation != "hex" or component != component.strip():
                 event.input.value = event.value[0:-1]
                 if self.sounds:
                     self.bell()
                 return
 
             if event.input.id == "hex":
-                try:
-                    self.color_hex = Color.parse(component)
-                except Exception:
+                if result.state == VALID:
+                    self.color_hex = Color(*result.value)
+                else:
                     self.color_hex = Color.parse("transparent")
+                    
+        elif self.query_one(TabbedContent).active == "any_tab":
+            result = parse_color(event.value)
+            color_inputs = self.query_one(".any-color-inputs")
+            if result.state == VALID:
+                color_inputs.border_subtitle = f"Parsed {result.notation} notation"
+                self.color_any = Color(*result.value)
+            elif result.state == PARTIAL:
+                color_inputs.border_subtitle = "Incomplete color..."
+            elif result.state == INVALID:
+                color_inputs.border_subtitle = "Unknown color"
+            else:
+                color_inputs.border_subtitle = ANY_COLOR_NOTATIONS
 
     
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -738,7 +907,4 @@ Switch {
 def main():
     app = ComputedApp()
     app.run()
-    
-if __name__ == "__main__":
-    app = ComputedApp()
-    app.run()
+
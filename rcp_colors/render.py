@@ -0,0 +1,93 @@
+import itertools
+import struct
+import zlib
+from typing import BinaryIO, Iterable, Iterator, List, TextIO, Tuple
+from .terminal import STANDARD, TRUECOLOR, quantize_index
+
+RGB = Tuple[int, int, int]
+
+FORMATS = ("ansi", "svg", "png")
+
+ANSI_SWATCH_WIDTH = 11
+ANSI_RESET = "\x1b[0m"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def tiles(colors: Iterable[RGB], columns: int) -> Iterator[List[RGB]]:
+    """Rows of up to `columns` colors, so only one row is held at a time."""
+    colors = iter(colors)
+    while True:
+        tile = list(itertools.islice(colors, columns))
+        if not tile:
+            return
+        yield tile
+
+
+def contrast_text(rgb: RGB) -> RGB:
+    brightness = (299 * rgb[0] + 587 * rgb[1] + 114 * rgb[2]) / 255000
+    return (0, 0, 0) if brightness > 0.5 else (255, 255, 255)
+
+
+def hex_code(rgb: RGB) -> str:
+    return f"#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
+
+
+def ansi_color(rgb: RGB, depth: int, background: bool) -> str:
+    if depth >= TRUECOLOR:
+        return f"{48 if background else 38};2;{rgb[0]};{rgb[1]};{rgb[2]}"
+    index = quantize_index(rgb[0], rgb[1], rgb[2], depth)
+    if depth > STANDARD:
+        return f"{48 if background else 38};5;{index}"
+    if index < 8:
+        return str((40 if background else 30) + index)
+    return str((100 if background else 90) + index - 8)
+
+
+def render_ansi(colors: Iterable[RGB], out: TextIO, columns: int, depth: int) -> None:
+    for tile in tiles(colors, columns):
+        top = "".join(f"\x1b[{ansi_color(rgb, depth, True)}m{' ' * ANSI_SWATCH_WIDTH}" for rgb in tile)
+        bottom = "".join(
+            f"\x1b[{ansi_color(rgb, depth, True)};{ansi_color(contrast_text(rgb), depth, False)}m{hex_code(rgb):^{ANSI_SWATCH_WIDTH}}"
+            for rgb in tile
+        )
+        out.write(f"{top}{ANSI_RESET}\n{bottom}{ANSI_RESET}\n")
+
+
+def render_svg(colors: Iterable[RGB], out: TextIO, columns: int, size: int, count: int) -> None:
+    rows = (count + columns - 1) // columns
+    width, height = min(count, columns) * size, rows * size
+    font_size = max(8, size // 6)
+    out.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n')
+    for row, tile in enumerate(tiles(colors, columns)):
+        for column, rgb in enumerate(tile):
+            x, y = column * size, row * size
+            r, g, b = contrast_text(rgb)
+            code = hex_code(rgb)
+            out.write(
+                f'<rect x="{x}" y="{y}" width="{size}" height="{size}" fill="{code}"/>'
+                f'<text x="{x + size // 2}" y="{y + size - font_size // 2}" font-family="monospace" font-size="{font_size}" '
+                f'text-anchor="middle" fill="rgb({r},{g},{b})">{code}</text>\n'
+            )
+    out.write("</svg>\n")
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def render_png(colors: Iterable[RGB], out: BinaryIO, columns: int, size: int, count: int) -> None:
+    """RGBA swatch sheet, compressed one row of swatches at a time. Empty cells are transparent."""
+    rows = (count + columns - 1) // columns
+    width = min(count, columns) * size
+    out.write(PNG_SIGNATURE)
+    out.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, rows * size, 8, 6, 0, 0, 0)))
+
+    compressor = zlib.compressobj()
+    for tile in tiles(colors, columns):
+        scanline = b"\x00" + b"".join(bytes((r, g, b, 255)) * size for r, g, b in tile)
+        scanline += bytes(width * 4 + 1 - len(scanline))
+        data = compressor.compress(scanline * size)
+        if data:
+            out.write(_png_chunk(b"IDAT", data))
+    out.write(_png_chunk(b"IDAT", compressor.flush()))
+    out.write(_png_chunk(b"IEND", b""))
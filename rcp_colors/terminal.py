@@ -0,0 +1,106 @@
+import os
+from typing import Dict, List, Mapping, Optional, Tuple
+
+STANDARD = 16
+EIGHT_BIT = 256
+TRUECOLOR = 1 << 24
+
+TEXTUAL_COLOR_SYSTEMS = {
+    "standard": STANDARD,
+    "256": EIGHT_BIT,
+    "truecolor": TRUECOLOR,
+}
+
+GRID_BITS = 5  # 32x32x32 lookup grid
+GRID_SIZE = 1 << GRID_BITS
+GRID_SHIFT = 8 - GRID_BITS
+CELL_MASK = (1 << GRID_SHIFT) - 1
+
+MIXED = -1  # cell whose colors don't all map to the same palette entry
+
+_tables = {}  # type: Dict[int, List[Optional[int]]]
+_palette = []  # type: List[Tuple[int, int, int]]
+
+
+def detect_color_depth(environ: Optional[Mapping[str, str]] = None) -> int:
+    """Number of colors the terminal can display, following the same rules as Textual and Rich."""
+    if environ is None:
+        environ = os.environ
+
+    forced = TEXTUAL_COLOR_SYSTEMS.get(environ.get("TEXTUAL_COLOR_SYSTEM", "").strip().lower())
+    if forced is not None:
+        return forced
+
+    if os.name == "nt":
+        return TRUECOLOR
+
+    colorterm = environ.get("COLORTERM", "").strip().lower()
+    if colorterm in ("truecolor", "24bit"):
+        return TRUECOLOR
+
+    term = environ.get("TERM", "").strip().lower()
+    _name, _hyphen, colors = term.rpartition("-")
+    if colors in ("256color", "kitty"):
+        return EIGHT_BIT
+    return STANDARD
+
+
+def _downgrade(red: int, green: int, blue: int, depth: int) -> int:
+    """Palette index Rich, and so Textual, writes to the terminal for the color."""
+    # Rich is only imported when a terminal actually needs fewer colors
+    from rich.color import Color, ColorSystem
+
+    system = ColorSystem.EIGHT_BIT if depth == EIGHT_BIT else ColorSystem.STANDARD
+    return Color.from_rgb(red, green, blue).downgrade(system).number
+
+
+def _cell_entry(position: int, depth: int) -> int:
+    low_red = (position >> (2 * GRID_BITS)) << GRID_SHIFT
+    low_green = ((position >> GRID_BITS) & (GRID_SIZE - 1)) << GRID_SHIFT
+    low_blue = (position & (GRID_SIZE - 1)) << GRID_SHIFT
+    corners = {
+        _downgrade(red, green, blue, depth)
+        for red in (low_red, low_red + CELL_MASK)
+        for green in (low_green, low_green + CELL_MASK)
+        for blue in (low_blue, low_blue + CELL_MASK)
+    }
+    return corners.pop() if len(corners) == 1 else MIXED
+
+
+def quantize_index(red: int, green: int, blue: int, depth: int) -> int:
+    """Palette index the terminal will use for the color.
+
+    Cells of the lookup grid are filled on first use from Rich's downgrade of
+    their corners. Cells where the corners disagree are refined by Rich's
+    nearest-palette match on the exact color.
+    """
+    table = _tables.get(depth)
+    if table is None:
+        table = _tables[depth] = [None] * GRID_SIZE ** 3
+    position = (
+        ((red >> GRID_SHIFT) << (2 * GRID_BITS))
+        | ((green >> GRID_SHIFT) << GRID_BITS)
+        | (blue >> GRID_SHIFT)
+    )
+    entry = table[position]
+    if entry is None:
+        entry = table[position] = _cell_entry(position, depth)
+    if entry == MIXED:
+        return _downgrade(red, green, blue, depth)
+    return entry
+
+
+def palette_color(index: int) -> Tuple[int, int, int]:
+    """RGB values Rich assumes for a palette index."""
+    if not _palette:
+        from rich.color import Color
+
+        _palette.extend(tuple(Color.from_ansi(number).get_truecolor()) for number in range(256))
+    return _palette[index]
+
+
+def quantize(red: int, green: int, blue: int, depth: int) -> Tuple[int, int, int]:
+    """Color the terminal will actually display for the given RGB values."""
+    if depth >= TRUECOLOR:
+        return (red, green, blue)
+    return palette_color(quantize_index(red, green, blue, depth))
@@ -0,0 +1,76 @@
+from typing import Dict, Iterable, List, Tuple
+
+NORMAL = "normal"
+
+# Machado, Oliveira and Fernandes (2009), severity 1.0, applied in linear RGB
+MATRICES = {
+    "protanopia": (
+        (0.152286, 1.052583, -0.204868),
+        (0.114503, 0.786281, 0.099216),
+        (-0.003882, -0.048116, 1.051998),
+    ),
+    "deuteranopia": (
+        (0.367322, 0.860646, -0.227968),
+        (0.280085, 0.672501, 0.047413),
+        (-0.011820, 0.042940, 0.968881),
+    ),
+    "tritanopia": (
+        (1.255528, -0.076749, -0.178779),
+        (-0.078411, 0.930809, 0.147602),
+        (0.004733, 0.691367, 0.303900),
+    ),
+}
+
+DEFICIENCIES = tuple(MATRICES)
+VISION_MODES = (NORMAL,) + DEFICIENCIES
+
+CACHE_LIMIT = 4096
+
+SRGB_TO_LINEAR = [
+    value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+    for value in (channel / 255 for channel in range(256))
+]
+
+_cache = {}  # type: Dict[Tuple[str, Tuple[int, int, int]], Tuple[int, int, int]]
+
+
+def linear_to_srgb(value: float) -> int:
+    if value <= 0.0:
+        return 0
+    if value >= 1.0:
+        return 255
+    if value <= 0.0031308:
+        return round(value * 12.92 * 255)
+    return round((1.055 * value ** (1 / 2.4) - 0.055) * 255)
+
+
+def simulate_palette(colors: Iterable[Tuple[int, int, int]], deficiency: str) -> List[Tuple[int, int, int]]:
+    """Colors as seen with the given deficiency.
+
+    Colors not cached yet are transformed together, one matrix row at a time
+    over whole channel columns.
+    """
+    colors = [tuple(rgb[:3]) for rgb in colors]
+    if deficiency == NORMAL:
+        return colors
+    if deficiency not in MATRICES:
+        raise ValueError(f"Unknown color vision deficiency: {deficiency!r}")
+
+    missing = [rgb for rgb in dict.fromkeys(colors) if (deficiency, rgb) not in _cache]
+    if missing:
+        red = [SRGB_TO_LINEAR[rgb[0]] for rgb in missing]
+        green = [SRGB_TO_LINEAR[rgb[1]] for rgb in missing]
+        blue = [SRGB_TO_LINEAR[rgb[2]] for rgb in missing]
+        columns = [
+            [linear_to_srgb(m_r * r + m_g * g + m_b * b) for r, g, b in zip(red, green, blue)]
+            for m_r, m_g, m_b in MATRICES[deficiency]
+        ]
+        if len(_cache) + len(missing) > CACHE_LIMIT:
+            _cache.clear()
+        _cache.update(zip(((deficiency, rgb) for rgb in missing), zip(*columns)))
+
+    return [_cache[(deficiency, rgb)] for rgb in colors]
+
+
+def simulate(red: int, green: int, blue: int, deficiency: str) -> Tuple[int, int, int]:
+    return simulate_palette([(red, green, blue)], deficiency)[0]
@@ -20,11 +20,12 @@ setup(
     python_requires='>=3.6, <4',
     install_requires=[
         'textual',
+        'rich',
         'appdirs',
     ],
     entry_points={
         'console_scripts': [
-            'rcp-colors=rcp_colors.rcp:main',
+            'rcp-colors=rcp_colors.cli:main',
         ],
     },
     project_urls={
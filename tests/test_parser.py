@@ -0,0 +1,26 @@
+import time
+import unittest
+from rcp_colors.parser import COLOR_GRAMMAR, INVALID, VALID, parse_color, parse_component
+
+
+class LongInputTest(unittest.TestCase):
+    """Pasted digit runs must be rejected quickly, not backtracked through or overflowed."""
+
+    def test_grammar_is_linear_on_long_digit_runs(self):
+        for text in ("rgb(" + "1" * 20000 + "x", "hsl(1 " + "1" * 20000 + "x", "oklch(0.5 0.1 " + "1" * 20000 + "x"):
+            start = time.perf_counter()
+            self.assertIsNone(COLOR_GRAMMAR.fullmatch(text))
+            self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_long_colors_are_invalid(self):
+        self.assertEqual(parse_color("rgb(" + "1" * 5000).state, INVALID)
+        self.assertEqual(parse_color("rgb(" + "9" * 100 + ",0,0)").state, VALID)
+
+    def test_oversized_values(self):
+        self.assertEqual(parse_color("oklch(0.5 " + "9" * 100 + " 30)").state, VALID)
+        self.assertEqual(parse_component("9" * 5000, "rgb").state, INVALID)
+        self.assertEqual(parse_component("9" * 5000, "hsl").state, INVALID)
+
+
+if __name__ == "__main__":
+    unittest.main()